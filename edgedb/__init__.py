@@ -21,165 +21,73 @@
 
 from ._version import __version__
 
-from edgedb.datatypes.datatypes import (
-    Tuple, NamedTuple, EnumValue, RelativeDuration, DateDuration, ConfigMemory
-)
-from edgedb.datatypes.datatypes import Set, Object, Array, Link, LinkSet
-from edgedb.datatypes.range import Range
-
-from .abstract import (
-    Executor, AsyncIOExecutor, ReadOnlyExecutor, AsyncIOReadOnlyExecutor,
-)
-
-from .asyncio_client import (
-    create_async_client,
-    AsyncIOClient
-)
+# Public names are resolved lazily on first attribute access (PEP 562),
+# so that `import edgedb` does not load the compiled extensions, nor
+# both client implementations, up front.  The static interface of the
+# namespace is spelled out in __init__.pyi.
+_LAZY = {
+    "Tuple": "edgedb.datatypes.datatypes",
+    "NamedTuple": "edgedb.datatypes.datatypes",
+    "EnumValue": "edgedb.datatypes.datatypes",
+    "RelativeDuration": "edgedb.datatypes.datatypes",
+    "DateDuration": "edgedb.datatypes.datatypes",
+    "ConfigMemory": "edgedb.datatypes.datatypes",
+    "Set": "edgedb.datatypes.datatypes",
+    "Object": "edgedb.datatypes.datatypes",
+    "Array": "edgedb.datatypes.datatypes",
+    "Link": "edgedb.datatypes.datatypes",
+    "LinkSet": "edgedb.datatypes.datatypes",
+    "Range": "edgedb.datatypes.range",
+    "Executor": "edgedb.abstract",
+    "AsyncIOExecutor": "edgedb.abstract",
+    "ReadOnlyExecutor": "edgedb.abstract",
+    "AsyncIOReadOnlyExecutor": "edgedb.abstract",
+    "create_async_client": "edgedb.asyncio_client",
+    "AsyncIOClient": "edgedb.asyncio_client",
+    "create_client": "edgedb.blocking_client",
+    "Client": "edgedb.blocking_client",
+    "Cardinality": "edgedb.enums",
+    "ElementKind": "edgedb.enums",
+    "RetryCondition": "edgedb.options",
+    "IsolationLevel": "edgedb.options",
+    "default_backoff": "edgedb.options",
+    "RetryOptions": "edgedb.options",
+    "TransactionOptions": "edgedb.options",
+    "State": "edgedb.options",
+    "EdgeDBError": "edgedb.errors._base",
+    "EdgeDBMessage": "edgedb.errors._base",
+}
 
-from .blocking_client import create_client, Client
-from .enums import Cardinality, ElementKind
-from .options import RetryCondition, IsolationLevel, default_backoff
-from .options import RetryOptions, TransactionOptions
-from .options import State
+# Submodules that used to be imported eagerly by `import edgedb`, kept
+# reachable as `edgedb.<submodule>` for backwards compatibility.
+_SUBMODULES = frozenset({
+    "abstract",
+    "asyncio_client",
+    "base_client",
+    "blocking_client",
+    "color",
+    "compat",
+    "con_utils",
+    "credentials",
+    "datatypes",
+    "describe",
+    "enums",
+    "errors",
+    "options",
+    "pgproto",
+    "platform",
+    "protocol",
+    "scram",
+    "transaction",
+})
 
-from .errors._base import EdgeDBError, EdgeDBMessage
-
-__all__ = [
-    "Array",
-    "AsyncIOClient",
-    "AsyncIOExecutor",
-    "AsyncIOReadOnlyExecutor",
-    "Cardinality",
-    "Client",
-    "ConfigMemory",
-    "DateDuration",
-    "EdgeDBError",
-    "EdgeDBMessage",
-    "ElementKind",
-    "EnumValue",
-    "Executor",
-    "IsolationLevel",
-    "Link",
-    "LinkSet",
-    "NamedTuple",
-    "Object",
-    "Range",
-    "ReadOnlyExecutor",
-    "RelativeDuration",
-    "RetryCondition",
-    "RetryOptions",
-    "Set",
-    "State",
-    "TransactionOptions",
-    "Tuple",
-    "create_async_client",
-    "create_client",
-    "default_backoff",
-]
 
 
 # The below is generated by `make gen-errors`.
 # DO NOT MODIFY BY HAND.
 #
 # <ERRORS-AUTOGEN>
-from .errors import (
-    InternalServerError,
-    UnsupportedFeatureError,
-    ProtocolError,
-    BinaryProtocolError,
-    UnsupportedProtocolVersionError,
-    TypeSpecNotFoundError,
-    UnexpectedMessageError,
-    InputDataError,
-    ParameterTypeMismatchError,
-    StateMismatchError,
-    ResultCardinalityMismatchError,
-    CapabilityError,
-    UnsupportedCapabilityError,
-    DisabledCapabilityError,
-    QueryError,
-    InvalidSyntaxError,
-    EdgeQLSyntaxError,
-    SchemaSyntaxError,
-    GraphQLSyntaxError,
-    InvalidTypeError,
-    InvalidTargetError,
-    InvalidLinkTargetError,
-    InvalidPropertyTargetError,
-    InvalidReferenceError,
-    UnknownModuleError,
-    UnknownLinkError,
-    UnknownPropertyError,
-    UnknownUserError,
-    UnknownDatabaseError,
-    UnknownParameterError,
-    SchemaError,
-    SchemaDefinitionError,
-    InvalidDefinitionError,
-    InvalidModuleDefinitionError,
-    InvalidLinkDefinitionError,
-    InvalidPropertyDefinitionError,
-    InvalidUserDefinitionError,
-    InvalidDatabaseDefinitionError,
-    InvalidOperatorDefinitionError,
-    InvalidAliasDefinitionError,
-    InvalidFunctionDefinitionError,
-    InvalidConstraintDefinitionError,
-    InvalidCastDefinitionError,
-    DuplicateDefinitionError,
-    DuplicateModuleDefinitionError,
-    DuplicateLinkDefinitionError,
-    DuplicatePropertyDefinitionError,
-    DuplicateUserDefinitionError,
-    DuplicateDatabaseDefinitionError,
-    DuplicateOperatorDefinitionError,
-    DuplicateViewDefinitionError,
-    DuplicateFunctionDefinitionError,
-    DuplicateConstraintDefinitionError,
-    DuplicateCastDefinitionError,
-    SessionTimeoutError,
-    IdleSessionTimeoutError,
-    QueryTimeoutError,
-    TransactionTimeoutError,
-    IdleTransactionTimeoutError,
-    ExecutionError,
-    InvalidValueError,
-    DivisionByZeroError,
-    NumericOutOfRangeError,
-    AccessPolicyError,
-    IntegrityError,
-    ConstraintViolationError,
-    CardinalityViolationError,
-    MissingRequiredError,
-    TransactionError,
-    TransactionConflictError,
-    TransactionSerializationError,
-    TransactionDeadlockError,
-    ConfigurationError,
-    AccessError,
-    AuthenticationError,
-    AvailabilityError,
-    BackendUnavailableError,
-    BackendError,
-    UnsupportedBackendFeatureError,
-    LogMessage,
-    WarningMessage,
-    ClientError,
-    ClientConnectionError,
-    ClientConnectionFailedError,
-    ClientConnectionFailedTemporarilyError,
-    ClientConnectionTimeoutError,
-    ClientConnectionClosedError,
-    InterfaceError,
-    QueryArgumentError,
-    MissingArgumentError,
-    UnknownArgumentError,
-    InvalidArgumentError,
-    NoDataError,
-    InternalClientError,
-)
-
-__all__.extend([
+_ERROR_NAMES = (
     "InternalServerError",
     "UnsupportedFeatureError",
     "ProtocolError",
@@ -274,5 +182,41 @@ __all__.extend([
     "InvalidArgumentError",
     "NoDataError",
     "InternalClientError",
-])
+)
+
+_ERROR_NAMES_SET = frozenset(_ERROR_NAMES)
 # </ERRORS-AUTOGEN>
+
+__all__ = [*_LAZY, *_ERROR_NAMES]
+
+
+def __getattr__(name):
+    import importlib
+
+    modname = _LAZY.get(name)
+    if modname is not None:
+        module = importlib.import_module(modname)
+        names = [
+            attr for attr, attr_modname in _LAZY.items()
+            if attr_modname == modname
+        ]
+    elif name in _ERROR_NAMES_SET:
+        # Error classes are not in _LAZY, they all come from edgedb.errors.
+        from . import errors as module
+        names = _ERROR_NAMES
+    elif name in _SUBMODULES:
+        return importlib.import_module(f'{__name__}.{name}')
+    else:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}')
+
+    # Cache every name provided by the module at once, so that none of
+    # them go through this function again.
+    ns = globals()
+    for attr in names:
+        ns[attr] = getattr(module, attr)
+    return ns[name]
+
+
+def __dir__():
+    return sorted({*globals(), *__all__, *_SUBMODULES})
@@ -0,0 +1,172 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2016-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+# Static interface of the lazily populated `edgedb` namespace
+# (see __init__.py) for type checkers and IDEs.
+
+from ._version import __version__ as __version__
+
+from edgedb.datatypes.datatypes import (
+    Tuple as Tuple,
+    NamedTuple as NamedTuple,
+    EnumValue as EnumValue,
+    RelativeDuration as RelativeDuration,
+    DateDuration as DateDuration,
+    ConfigMemory as ConfigMemory,
+    Set as Set,
+    Object as Object,
+    Array as Array,
+    Link as Link,
+    LinkSet as LinkSet,
+)
+from edgedb.datatypes.range import Range as Range
+
+from .abstract import (
+    Executor as Executor,
+    AsyncIOExecutor as AsyncIOExecutor,
+    ReadOnlyExecutor as ReadOnlyExecutor,
+    AsyncIOReadOnlyExecutor as AsyncIOReadOnlyExecutor,
+)
+
+from .asyncio_client import (
+    create_async_client as create_async_client,
+    AsyncIOClient as AsyncIOClient,
+)
+
+from .blocking_client import (
+    create_client as create_client,
+    Client as Client,
+)
+from .enums import Cardinality as Cardinality, ElementKind as ElementKind
+from .options import (
+    RetryCondition as RetryCondition,
+    IsolationLevel as IsolationLevel,
+    default_backoff as default_backoff,
+    RetryOptions as RetryOptions,
+    TransactionOptions as TransactionOptions,
+    State as State,
+)
+
+from .errors._base import (
+    EdgeDBError as EdgeDBError,
+    EdgeDBMessage as EdgeDBMessage,
+)
+
+
+# The below is generated by `make gen-errors`.
+# DO NOT MODIFY BY HAND.
+#
+# <ERRORS-AUTOGEN>
+from .errors import (
+    InternalServerError as InternalServerError,
+    UnsupportedFeatureError as UnsupportedFeatureError,
+    ProtocolError as ProtocolError,
+    BinaryProtocolError as BinaryProtocolError,
+    UnsupportedProtocolVersionError as UnsupportedProtocolVersionError,
+    TypeSpecNotFoundError as TypeSpecNotFoundError,
+    UnexpectedMessageError as UnexpectedMessageError,
+    InputDataError as InputDataError,
+    ParameterTypeMismatchError as ParameterTypeMismatchError,
+    StateMismatchError as StateMismatchError,
+    ResultCardinalityMismatchError as ResultCardinalityMismatchError,
+    CapabilityError as CapabilityError,
+    UnsupportedCapabilityError as UnsupportedCapabilityError,
+    DisabledCapabilityError as DisabledCapabilityError,
+    QueryError as QueryError,
+    InvalidSyntaxError as InvalidSyntaxError,
+    EdgeQLSyntaxError as EdgeQLSyntaxError,
+    SchemaSyntaxError as SchemaSyntaxError,
+    GraphQLSyntaxError as GraphQLSyntaxError,
+    InvalidTypeError as InvalidTypeError,
+    InvalidTargetError as InvalidTargetError,
+    InvalidLinkTargetError as InvalidLinkTargetError,
+    InvalidPropertyTargetError as InvalidPropertyTargetError,
+    InvalidReferenceError as InvalidReferenceError,
+    UnknownModuleError as UnknownModuleError,
+    UnknownLinkError as UnknownLinkError,
+    UnknownPropertyError as UnknownPropertyError,
+    UnknownUserError as UnknownUserError,
+    UnknownDatabaseError as UnknownDatabaseError,
+    UnknownParameterError as UnknownParameterError,
+    SchemaError as SchemaError,
+    SchemaDefinitionError as SchemaDefinitionError,
+    InvalidDefinitionError as InvalidDefinitionError,
+    InvalidModuleDefinitionError as InvalidModuleDefinitionError,
+    InvalidLinkDefinitionError as InvalidLinkDefinitionError,
+    InvalidPropertyDefinitionError as InvalidPropertyDefinitionError,
+    InvalidUserDefinitionError as InvalidUserDefinitionError,
+    InvalidDatabaseDefinitionError as InvalidDatabaseDefinitionError,
+    InvalidOperatorDefinitionError as InvalidOperatorDefinitionError,
+    InvalidAliasDefinitionError as InvalidAliasDefinitionError,
+    InvalidFunctionDefinitionError as InvalidFunctionDefinitionError,
+    InvalidConstraintDefinitionError as InvalidConstraintDefinitionError,
+    InvalidCastDefinitionError as InvalidCastDefinitionError,
+    DuplicateDefinitionError as DuplicateDefinitionError,
+    DuplicateModuleDefinitionError as DuplicateModuleDefinitionError,
+    DuplicateLinkDefinitionError as DuplicateLinkDefinitionError,
+    DuplicatePropertyDefinitionError as DuplicatePropertyDefinitionError,
+    DuplicateUserDefinitionError as DuplicateUserDefinitionError,
+    DuplicateDatabaseDefinitionError as DuplicateDatabaseDefinitionError,
+    DuplicateOperatorDefinitionError as DuplicateOperatorDefinitionError,
+    DuplicateViewDefinitionError as DuplicateViewDefinitionError,
+    DuplicateFunctionDefinitionError as DuplicateFunctionDefinitionError,
+    DuplicateConstraintDefinitionError as DuplicateConstraintDefinitionError,
+    DuplicateCastDefinitionError as DuplicateCastDefinitionError,
+    SessionTimeoutError as SessionTimeoutError,
+    IdleSessionTimeoutError as IdleSessionTimeoutError,
+    QueryTimeoutError as QueryTimeoutError,
+    TransactionTimeoutError as TransactionTimeoutError,
+    IdleTransactionTimeoutError as IdleTransactionTimeoutError,
+    ExecutionError as ExecutionError,
+    InvalidValueError as InvalidValueError,
+    DivisionByZeroError as DivisionByZeroError,
+    NumericOutOfRangeError as NumericOutOfRangeError,
+    AccessPolicyError as AccessPolicyError,
+    IntegrityError as IntegrityError,
+    ConstraintViolationError as ConstraintViolationError,
+    CardinalityViolationError as CardinalityViolationError,
+    MissingRequiredError as MissingRequiredError,
+    TransactionError as TransactionError,
+    TransactionConflictError as TransactionConflictError,
+    TransactionSerializationError as TransactionSerializationError,
+    TransactionDeadlockError as TransactionDeadlockError,
+    ConfigurationError as ConfigurationError,
+    AccessError as AccessError,
+    AuthenticationError as AuthenticationError,
+    AvailabilityError as AvailabilityError,
+    BackendUnavailableError as BackendUnavailableError,
+    BackendError as BackendError,
+    UnsupportedBackendFeatureError as UnsupportedBackendFeatureError,
+    LogMessage as LogMessage,
+    WarningMessage as WarningMessage,
+    ClientError as ClientError,
+    ClientConnectionError as ClientConnectionError,
+    ClientConnectionFailedError as ClientConnectionFailedError,
+    ClientConnectionFailedTemporarilyError as ClientConnectionFailedTemporarilyError,
+    ClientConnectionTimeoutError as ClientConnectionTimeoutError,
+    ClientConnectionClosedError as ClientConnectionClosedError,
+    InterfaceError as InterfaceError,
+    QueryArgumentError as QueryArgumentError,
+    MissingArgumentError as MissingArgumentError,
+    UnknownArgumentError as UnknownArgumentError,
+    InvalidArgumentError as InvalidArgumentError,
+    NoDataError as NoDataError,
+    InternalClientError as InternalClientError,
+)
+# </ERRORS-AUTOGEN>
@@ -18,6 +18,7 @@
 
 
 import asyncio
+import collections
 import logging
 import socket
 import ssl
@@ -39,6 +40,10 @@ __all__ = (
 
 logger = logging.getLogger(__name__)
 
+# CancelledError is not an Exception subclass since Python 3.8, cleanup
+# paths that must also run on cancellation catch both.
+_ERRORS_AND_CANCELLATION = (Exception, asyncio.CancelledError)
+
 
 class AsyncIOConnection(base_client.BaseConnection):
     __slots__ = ("_loop",)
@@ -66,7 +71,7 @@ class AsyncIOConnection(base_client.BaseConnection):
             try:
                 self._protocol.terminate()
                 await self._protocol.wait_for_disconnect()
-            except (Exception, asyncio.CancelledError):
+            except _ERRORS_AND_CANCELLATION:
                 self.terminate()
                 raise
             finally:
@@ -138,14 +143,93 @@ class _PoolConnectionHolder(base_client.PoolConnectionHolder):
         if wait:
             await self._con.aclose()
         else:
-            self._pool._loop.create_task(self._con.aclose())
+            self._pool._create_task(self._con.aclose())
 
     async def wait_until_released(self, timeout=None):
         await self._release_event.wait()
 
 
+class _SyncQueue:
+    """Free connection holders of a pool.
+
+    Free holders are kept in a LIFO stack, so that the most recently
+    used connection is reused first, while acquirers waiting for a
+    holder are served in FIFO order.  A holder put back while somebody
+    is waiting is handed to the oldest waiter directly, so the two
+    sides never both hold entries at the same time.
+    """
+
+    __slots__ = ('_create_future', '_items', '_waiters')
+
+    def __init__(self, loop):
+        self._create_future = loop.create_future
+        self._items = []
+        self._waiters = collections.deque()
+
+    def qsize(self):
+        return len(self._items)
+
+    def put_nowait(self, holder):
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(holder)
+                return
+        self._items.append(holder)
+
+    def pop_free(self):
+        """Return a free holder, or None if there are none."""
+        if self._items:
+            return self._items.pop()
+        return None
+
+    def pop_unconnected(self):
+        """Remove and return the free holders that have no connection."""
+        items = self._items
+        unconnected = [ch for ch in items if ch._con is None]
+        if unconnected:
+            items[:] = [ch for ch in items if ch._con is not None]
+        return unconnected
+
+    def put_cold_nowait(self, holders):
+        """Put back holders that should be reused after all others.
+
+        Waiting acquirers are handed holders first, the rest go to the
+        bottom of the stack in their original order, so that the most
+        recently used connections stay on top.
+        """
+        holders = list(holders)
+        while holders and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(holders.pop())
+        self._items[:0] = holders
+
+    async def get(self):
+        """Wait until a holder is handed to us."""
+        waiter = self._create_future()
+        self._waiters.append(waiter)
+        try:
+            return await waiter
+        except _ERRORS_AND_CANCELLATION:
+            if waiter.done() and not waiter.cancelled():
+                # We were handed a holder but got cancelled
+                # before we could use it, pass it on.
+                self.put_nowait(waiter.result())
+            else:
+                # Drop the waiter right away, like asyncio.Queue does,
+                # or every timed out acquire() would leave one behind
+                # for as long as the pool stays exhausted.
+                waiter.cancel()
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+
+
 class _AsyncIOPoolImpl(base_client.BasePoolImpl):
-    __slots__ = ('_loop',)
+    __slots__ = ('_loop', '_create_task', '_preconnect')
     _holder_class = _PoolConnectionHolder
 
     def __init__(
@@ -154,6 +238,7 @@ class _AsyncIOPoolImpl(base_client.BasePoolImpl):
         *,
         max_concurrency: typing.Optional[int],
         connection_class,
+        preconnect: bool = False,
     ):
         if not issubclass(connection_class, AsyncIOConnection):
             raise TypeError(
@@ -161,6 +246,7 @@ class _AsyncIOPoolImpl(base_client.BasePoolImpl):
                 f'edgedb.asyncio_client.AsyncIOConnection, '
                 f'got {connection_class}')
         self._loop = None
+        self._preconnect = preconnect
         super().__init__(
             connect_args,
             lambda *args: connection_class(self._loop, *args),
@@ -170,12 +256,45 @@ class _AsyncIOPoolImpl(base_client.BasePoolImpl):
     def _ensure_initialized(self):
         if self._loop is None:
             self._loop = asyncio.get_event_loop()
-            self._queue = asyncio.LifoQueue(maxsize=self._max_concurrency)
+            self._create_task = self._loop.create_task
+            self._queue = _SyncQueue(self._loop)
             self._first_connect_lock = asyncio.Lock()
             self._resize_holder_pool()
 
-    def _set_queue_maxsize(self, maxsize):
-        self._queue._maxsize = maxsize
+    async def ensure_connected(self):
+        await super().ensure_connected()
+        if self._preconnect:
+            await self._connect_free_holders()
+
+    async def _connect_free_holders(self):
+        if self._closing or self._closed:
+            return
+
+        # Take the unconnected free holders out of the pool while they
+        # connect, so that concurrent acquire() calls do not try to
+        # connect them too.  Connected holders stay available.
+        holders = self._queue.pop_unconnected()
+        if not holders:
+            return
+        try:
+            results = await asyncio.gather(
+                *(ch.connect() for ch in holders),
+                return_exceptions=True,
+            )
+        finally:
+            if self._closing or self._closed:
+                # aclose() skipped these holders, as they had no
+                # connection when it started, so close them here.
+                await asyncio.gather(
+                    *(ch.close() for ch in holders),
+                    return_exceptions=True,
+                )
+            else:
+                self._queue.put_cold_nowait(holders)
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     async def _maybe_get_first_connection(self):
         async with self._first_connect_lock:
@@ -185,41 +304,42 @@ class _AsyncIOPoolImpl(base_client.BasePoolImpl):
     async def acquire(self, timeout=None):
         self._ensure_initialized()
 
-        async def _acquire_impl():
-            ch = await self._queue.get()  # type: _PoolConnectionHolder
-            try:
-                proxy = await ch.acquire()  # type: AsyncIOConnection
-            except (Exception, asyncio.CancelledError):
-                self._queue.put_nowait(ch)
-                raise
-            else:
-                # Record the timeout, as we will apply it by default
-                # in release().
-                ch._timeout = timeout
-                return proxy
-
         if self._closing:
             raise errors.InterfaceError('pool is closing')
 
         if timeout is None:
-            return await _acquire_impl()
+            return await self._acquire_impl(timeout)
         else:
             return await compat.wait_for(
-                _acquire_impl(), timeout=timeout)
-
-    async def _release(self, holder):
+                self._acquire_impl(timeout), timeout=timeout)
 
-        if not isinstance(holder._con, AsyncIOConnection):
-            raise errors.InterfaceError(
-                f'release() received invalid connection: '
-                f'{holder._con!r} does not belong to any connection pool'
-            )
+    async def _acquire_impl(self, timeout):
+        ch = self._queue.pop_free()  # type: _PoolConnectionHolder
+        if ch is None:
+            ch = await self._queue.get()
+        try:
+            proxy = await ch.acquire()  # type: AsyncIOConnection
+        except _ERRORS_AND_CANCELLATION:
+            self._queue.put_nowait(ch)
+            raise
+        else:
+            # Record the timeout, as we will apply it by default
+            # in release().
+            ch._timeout = timeout
+            return proxy
 
+    async def _release(self, holder):
         timeout = None
 
+        if holder._generation == self._generation:
+            # Unless the connection has expired, holder.release() never
+            # suspends, so task cancellation cannot interrupt it and
+            # there is no need to pay for asyncio.shield().
+            return await holder.release(timeout)
+
         # Use asyncio.shield() to guarantee that task cancellation
-        # does not prevent the connection from being returned to the
-        # pool properly.
+        # does not prevent the expired connection from being closed
+        # and returned to the pool properly.
         return await asyncio.shield(holder.release(timeout))
 
     async def aclose(self):
@@ -246,15 +366,23 @@ class _AsyncIOPoolImpl(base_client.BasePoolImpl):
             warning_callback = self._loop.call_later(
                 60, self._warn_on_long_close)
 
-            release_coros = [
-                ch.wait_until_released() for ch in self._holders]
-            await asyncio.gather(*release_coros)
-
-            close_coros = [
-                ch.close() for ch in self._holders]
-            await asyncio.gather(*close_coros)
-
-        except (Exception, asyncio.CancelledError):
+            async def _wait_and_close(ch):
+                await ch.wait_until_released()
+                await ch.close()
+
+            # Holders that never connected are free and have nothing
+            # to close, so do not spawn a task for each of them.  Free
+            # holders are closed right away, busy ones as soon as they
+            # are released, rather than waiting for all of them to be
+            # released first.
+            connected = [ch for ch in self._holders if ch._con is not None]
+            await asyncio.gather(*(
+                ch.close() if ch._release_event.is_set()
+                else _wait_and_close(ch)
+                for ch in connected
+            ))
+
+        except _ERRORS_AND_CANCELLATION:
             self.terminate()
             raise
 
@@ -385,10 +513,12 @@ def create_async_client(
     tls_security: str = None,
     wait_until_available: int = 30,
     timeout: int = 10,
+    preconnect: bool = False,
 ):
     return AsyncIOClient(
         connection_class=AsyncIOConnection,
         max_concurrency=max_concurrency,
+        preconnect=preconnect,
 
         # connect arguments
         dsn=dsn,
@@ -88,8 +88,9 @@ class BaseConnection(metaclass=abc.ABCMeta):
 
     def _cleanup(self):
         self._log_listeners.clear()
-        if self._holder:
-            self._holder._release_on_close()
+        holder = self._holder
+        if holder is not None:
+            holder._release_on_close()
             self._holder = None
 
     def add_log_listener(
@@ -313,14 +314,14 @@ class BaseConnection(metaclass=abc.ABCMeta):
                 self._cleanup()
 
     def __repr__(self):
+        classname = type(self).__name__
         if self.is_closed():
-            return '<{classname} [closed] {id:#x}>'.format(
-                classname=self.__class__.__name__, id=id(self))
+            return f'<{classname} [closed] {id(self):#x}>'
         else:
-            return '<{classname} [connected to {addr}] {id:#x}>'.format(
-                classname=self.__class__.__name__,
-                addr=self.connected_addr(),
-                id=id(self))
+            return (
+                f'<{classname} [connected to {self.connected_addr()}] '
+                f'{id(self):#x}>'
+            )
 
 
 class PoolConnectionHolder(abc.ABC):
@@ -488,10 +489,6 @@ class BasePoolImpl(abc.ABC):
     def _ensure_initialized(self):
         ...
 
-    @abc.abstractmethod
-    def _set_queue_maxsize(self, maxsize):
-        ...
-
     @abc.abstractmethod
     async def _maybe_get_first_connection(self):
         ...
@@ -516,9 +513,6 @@ class BasePoolImpl(abc.ABC):
         resize_diff = self._max_concurrency - len(self._holders)
 
         if (resize_diff > 0):
-            if self._queue.maxsize != self._max_concurrency:
-                self._set_queue_maxsize(self._max_concurrency)
-
             for _ in range(resize_diff):
                 ch = self._holder_class(self)
 
@@ -533,7 +527,8 @@ class BasePoolImpl(abc.ABC):
 
     def get_free_size(self):
         if self._queue is None:
-            # Queue has not been initialized yet
+            # The pool has not been used yet, its holders are created
+            # on first use and will all be free.
             return self._max_concurrency
 
         return self._queue.qsize()
@@ -626,6 +621,19 @@ class BasePoolImpl(abc.ABC):
 
         return await self._release(ch)
 
+    async def _release_fast(self, connection):
+        """Release a connection returned by acquire() of this pool.
+
+        Unlike release(), this does not validate the connection, and
+        is meant for the client's own query paths only.
+        """
+        ch = connection._holder
+        if ch is None:
+            # Already released, do nothing.
+            return
+
+        return await self._release(ch)
+
     def terminate(self):
         """Terminate all connections in the pool."""
         if self._closed:
@@ -738,14 +746,14 @@ class BaseClient(abstract.BaseReadOnlyExecutor, _options._OptionsMixin):
         try:
             return await con.raw_query(query_context)
         finally:
-            await self._impl.release(con)
+            await self._impl._release_fast(con)
 
     async def _execute(self, execute_context: abstract.ExecuteContext) -> None:
         con = await self._impl.acquire()
         try:
             await con._execute(execute_context)
         finally:
-            await self._impl.release(con)
+            await self._impl._release_fast(con)
 
     async def _describe(
         self, describe_context: abstract.DescribeContext
@@ -754,7 +762,7 @@ class BaseClient(abstract.BaseReadOnlyExecutor, _options._OptionsMixin):
         try:
             return await con.describe(describe_context)
         finally:
-            await self._impl.release(con)
+            await self._impl._release_fast(con)
 
     def terminate(self):
         """Terminate all connections in the pool."""
@@ -191,14 +191,10 @@ class _PoolImpl(base_client.BasePoolImpl):
 
     def _ensure_initialized(self):
         if self._queue is None:
-            self._queue = queue.LifoQueue(maxsize=self._max_concurrency)
+            self._queue = queue.LifoQueue()
             self._first_connect_lock = threading.Lock()
             self._resize_holder_pool()
 
-    def _set_queue_maxsize(self, maxsize):
-        with self._queue.mutex:
-            self._queue.maxsize = maxsize
-
     async def _maybe_get_first_connection(self):
         with self._first_connect_lock:
             if self._working_addr is None:
@@ -223,12 +219,6 @@ class _PoolImpl(base_client.BasePoolImpl):
             return con
 
     async def _release(self, holder):
-        if not isinstance(holder._con, BlockingIOConnection):
-            raise errors.InterfaceError(
-                f'release() received invalid connection: '
-                f'{holder._con!r} does not belong to any connection pool'
-            )
-
         timeout = None
         return await holder.release(timeout)
 
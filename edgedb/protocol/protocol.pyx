@@ -21,7 +21,6 @@ cimport cython
 cimport cpython
 cimport cpython.datetime
 
-import asyncio
 import collections
 import datetime
 import json
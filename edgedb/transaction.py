@@ -170,7 +170,7 @@ class BaseTransaction:
             # NOTE: rollback error is always swallowed, should we use
             # on_log_message for it?
         finally:
-            await self._client._impl.release(self._connection)
+            await self._client._impl._release_fast(self._connection)
 
         if (
             extype is not None and
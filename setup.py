@@ -291,7 +291,7 @@ setuptools.setup(
     provides=['edgedb'],
     zip_safe=False,
     include_package_data=True,
-    package_data={'edgedb': ['py.typed']},
+    package_data={'edgedb': ['py.typed', '__init__.pyi']},
     ext_modules=[
         distutils_extension.Extension(
             "edgedb.pgproto.pgproto",
@@ -130,6 +130,46 @@ class TestAsyncIOClient(tb.AsyncQueryTestCase):
 
             await client.query_single("SELECT 1")
 
+    async def test_client_acquire_fifo(self):
+        async with self.create_client(max_concurrency=1) as client:
+            events = []
+
+            async def busy():
+                for _ in range(3):
+                    await client.query_single("SELECT 1")
+                    events.append('busy')
+
+            async def worker(i):
+                await client.query_single("SELECT 1")
+                events.append(i)
+
+            # Let `busy` take the only connection before the workers
+            # start waiting for it.
+            busy_task = self.loop.create_task(busy())
+            await asyncio.sleep(0)
+            await asyncio.gather(busy_task, *(worker(i) for i in range(3)))
+
+            # A task releasing and immediately re-acquiring the connection
+            # must queue behind the tasks that were already waiting.
+            self.assertEqual(events, ['busy', 0, 1, 2, 'busy', 'busy'])
+
+    async def test_client_acquire_timeout(self):
+        async with self.create_client(max_concurrency=1) as client:
+            impl = client._impl
+            con = await impl.acquire()
+            try:
+                for _ in range(3):
+                    with self.assertRaises(asyncio.TimeoutError):
+                        await impl.acquire(timeout=0.01)
+
+                # Timed out acquire() calls must not leave their waiters
+                # behind in the queue.
+                self.assertEqual(len(impl._queue._waiters), 0)
+            finally:
+                await impl.release(con)
+
+            self.assertEqual(await client.query_single("SELECT 1"), 1)
+
     async def test_client_config_persistence(self):
         N = 100
 
@@ -472,6 +512,61 @@ class TestAsyncIOClient(tb.AsyncQueryTestCase):
 
         await client.aclose()
 
+    async def test_client_preconnect(self):
+        client = self.create_client(max_concurrency=3, preconnect=True)
+        try:
+            await client.ensure_connected()
+            self.assertEqual(client.free_size, 3)
+            for ch in client._impl._holders:
+                self.assertIsNotNone(ch._con)
+                self.assertFalse(ch._con.is_closed())
+
+            self.assertEqual(await client.query_single("SELECT 1"), 1)
+        finally:
+            await client.aclose()
+
+        client = self.create_client(max_concurrency=3)
+        try:
+            await client.ensure_connected()
+            self.assertEqual(
+                sum(ch._con is not None for ch in client._impl._holders), 1)
+        finally:
+            await client.aclose()
+
+    async def test_client_preconnect_concurrent(self):
+        client = self.create_client(max_concurrency=3, preconnect=True)
+        try:
+            await client.ensure_connected()
+
+            # Drop one connection, so that the next ensure_connected()
+            # has a holder to reconnect while queries keep running on
+            # the connected ones.
+            await client._impl._holders[0]._con.aclose()
+            self.assertIsNone(client._impl._holders[0]._con)
+
+            results = await asyncio.gather(
+                client.ensure_connected(),
+                *(client.query_single("SELECT 1") for _ in range(10)),
+            )
+            self.assertEqual(results[1:], [1] * 10)
+
+            self.assertEqual(client.free_size, 3)
+            for ch in client._impl._holders:
+                self.assertIsNotNone(ch._con)
+                self.assertFalse(ch._con.is_closed())
+
+            # Closing the client while holders are being connected must
+            # not leave their connections open.
+            await client._impl._holders[0]._con.aclose()
+            task = self.loop.create_task(client.ensure_connected())
+            await asyncio.sleep(0)
+        finally:
+            await client.aclose()
+
+        await task
+        for ch in client._impl._holders:
+            self.assertTrue(ch._con is None or ch._con.is_closed())
+
     def test_client_with_different_loop(self):
         conargs = self.get_connect_args()
         client = edgedb.create_async_client(**conargs)
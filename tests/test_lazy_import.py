@@ -0,0 +1,159 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2016-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import ast
+import os
+import subprocess
+import sys
+import textwrap
+import unittest
+
+import edgedb
+
+
+class TestLazyImport(unittest.TestCase):
+
+    def run_fresh(self, code):
+        # Every check runs in a fresh interpreter, as `sys.modules` of
+        # the test runner already has most of edgedb imported.
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.path.dirname(os.path.dirname(edgedb.__file__))
+        subprocess.run(
+            [sys.executable, '-c', textwrap.dedent(code)],
+            check=True,
+            env=env,
+        )
+
+    def test_lazy_import_01(self):
+        self.run_fresh('''
+            import sys
+            import edgedb
+
+            loaded = {m for m in sys.modules if m.startswith('edgedb.')}
+            assert loaded == {'edgedb._version'}, loaded
+        ''')
+
+    def test_lazy_import_02(self):
+        self.run_fresh('''
+            import sys
+            import edgedb
+
+            err = edgedb.QueryError
+            assert err is sys.modules['edgedb.errors'].QueryError
+            assert vars(edgedb)['QueryError'] is err
+            assert edgedb.errors.QueryError is err
+            assert 'edgedb.asyncio_client' not in sys.modules
+            assert 'edgedb.blocking_client' not in sys.modules
+        ''')
+
+    def test_lazy_import_03(self):
+        self.run_fresh('''
+            import sys
+            import edgedb
+
+            try:
+                edgedb.NoSuchName
+            except AttributeError:
+                pass
+            else:
+                raise AssertionError('AttributeError was not raised')
+
+            assert not hasattr(edgedb, 'NoSuchName')
+            assert set(edgedb.__all__) <= set(dir(edgedb))
+            assert edgedb._SUBMODULES <= set(dir(edgedb))
+
+            for name in edgedb._SUBMODULES:
+                mod = getattr(edgedb, name)
+                assert mod is sys.modules[f'edgedb.{name}'], name
+        ''')
+
+    def test_lazy_import_04(self):
+        self.run_fresh('''
+            import edgedb
+
+            for name in edgedb.__all__:
+                getattr(edgedb, name)
+        ''')
+
+    def test_lazy_import_05(self):
+        # Pure-Python parts of the API must not drag in the compiled
+        # protocol extensions.
+        self.run_fresh('''
+            import sys
+            import edgedb
+
+            edgedb.EdgeDBError
+            edgedb.ClientConnectionError
+            edgedb.Cardinality
+            edgedb.RetryOptions
+            edgedb.Range
+
+            for mod in ('edgedb.protocol.protocol', 'edgedb.pgproto.pgproto',
+                        'edgedb.datatypes.datatypes'):
+                assert mod not in sys.modules, mod
+        ''')
+
+    def test_lazy_import_06(self):
+        self.run_fresh('''
+            import sys
+            import edgedb
+
+            edgedb.create_client
+            assert 'edgedb.blocking_client' in sys.modules
+            assert 'edgedb.asyncio_client' not in sys.modules
+            assert 'edgedb.protocol.asyncio_proto' not in sys.modules
+        ''')
+
+        self.run_fresh('''
+            import sys
+            import edgedb
+
+            edgedb.create_async_client
+            assert 'edgedb.asyncio_client' in sys.modules
+            assert 'edgedb.blocking_client' not in sys.modules
+            assert 'edgedb.protocol.blocking_proto' not in sys.modules
+        ''')
+
+    def test_lazy_import_07(self):
+        # Resolving one name binds all names coming from the same module.
+        self.run_fresh('''
+            import edgedb
+
+            edgedb.QueryError
+            ns = vars(edgedb)
+            assert ns['ClientError'] is edgedb.errors.ClientError
+            assert ns['NoDataError'] is edgedb.errors.NoDataError
+            assert 'EdgeDBError' not in ns
+            assert 'RetryOptions' not in ns
+        ''')
+
+    def test_lazy_import_stub(self):
+        stub_fn = os.path.join(
+            os.path.dirname(edgedb.__file__), '__init__.pyi')
+        with open(stub_fn) as f:
+            stub = ast.parse(f.read())
+
+        reexported = set()
+        for node in stub.body:
+            if isinstance(node, ast.ImportFrom):
+                for alias in node.names:
+                    self.assertEqual(alias.asname, alias.name)
+                    reexported.add(alias.name)
+
+        self.assertEqual(reexported, {'__version__', *edgedb.__all__})
@@ -21,24 +21,8 @@ import pathlib
 import re
 
 
-if __name__ == '__main__':
-    this = pathlib.Path(__file__)
-
-    errors_fn = this.parent.parent / 'edgedb' / 'errors' / '__init__.py'
-    init_fn = this.parent.parent / 'edgedb' / '__init__.py'
-
-    with open(errors_fn, 'rt') as f:
-        errors_txt = f.read()
-
-    names = re.findall(r'^class\s+(?P<name>\w+)', errors_txt, re.M)
-    names_list = '\n'.join(f'    {name},' for name in names)
-    all_list = '\n'.join(f'    "{name}",' for name in names)
-    code = (
-        f'''from .errors import (\n{names_list}\n)\n'''
-        f'''\n__all__.extend([\n{all_list}\n])\n'''
-    ).splitlines()
-
-    with open(init_fn, 'rt') as f:
+def replace_autogen(fn, code):
+    with open(fn, 'rt') as f:
         lines = f.read().splitlines()
         start = end = -1
         for no, line in enumerate(lines):
@@ -48,13 +32,39 @@ if __name__ == '__main__':
                 end = no
 
     if start == -1:
-        raise RuntimeError('could not find the <ERRORS-AUTOGEN> tag')
+        raise RuntimeError(f'could not find the <ERRORS-AUTOGEN> tag in {fn}')
 
     if end == -1:
-        raise RuntimeError('could not find the </ERRORS-AUTOGEN> tag')
+        raise RuntimeError(
+            f'could not find the </ERRORS-AUTOGEN> tag in {fn}')
 
-    lines[start + 1:end] = code
+    lines[start + 1:end] = code.splitlines()
 
-    with open(init_fn, 'w') as f:
+    with open(fn, 'w') as f:
         f.write('\n'.join(lines))
         f.write('\n')
+
+
+if __name__ == '__main__':
+    this = pathlib.Path(__file__)
+
+    errors_fn = this.parent.parent / 'edgedb' / 'errors' / '__init__.py'
+    init_fn = this.parent.parent / 'edgedb' / '__init__.py'
+    stub_fn = this.parent.parent / 'edgedb' / '__init__.pyi'
+
+    with open(errors_fn, 'rt') as f:
+        errors_txt = f.read()
+
+    names = re.findall(r'^class\s+(?P<name>\w+)', errors_txt, re.M)
+    names_list = '\n'.join(f'    "{name}",' for name in names)
+    replace_autogen(
+        init_fn,
+        f'''_ERROR_NAMES = (\n{names_list}\n)\n'''
+        f'''\n_ERROR_NAMES_SET = frozenset(_ERROR_NAMES)\n''',
+    )
+
+    reexport_list = '\n'.join(f'    {name} as {name},' for name in names)
+    replace_autogen(
+        stub_fn,
+        f'''from .errors import (\n{reexport_list}\n)\n''',
+    )